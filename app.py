@@ -1,11 +1,10 @@
 import dash
 from dash import dcc, html
-from dash.dependencies import Input, Output
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
-import os # Needed to import pages
+import os # For the VIBE_NUMBA_WARMUP gate
+
+# Heavy numeric deps (pandas/numpy/plotly) are imported by the page modules
+# that actually use them, not here -- keeps app construction lean.
 
 # --- CONFIGURATION ---
 # Use a dark, bold theme for Dash Bootstrap
@@ -15,6 +14,13 @@ EXTERNAL_STYLESHEETS = [dbc.themes.SLATE]
 # use_pages=True enables the multi-page functionality
 app = dash.Dash(__name__, external_stylesheets=EXTERNAL_STYLESHEETS, use_pages=True, suppress_callback_exceptions=True)
 
+# Warm the Numba color kernels at startup so the first learner-trend render
+# doesn't pay the JIT compile cost (cache=True on the kernels makes later
+# process starts hit the on-disk cache instead of recompiling).
+if os.environ.get("VIBE_NUMBA_WARMUP", "1") == "1":
+    from pages.live_dashboard import scores_to_hex
+    scores_to_hex([50])
+
 # Define custom styles for the aggressive cyber theme
 SIDEBAR_STYLE = {
     "position": "fixed",
@@ -39,35 +45,42 @@ CONTENT_STYLE = {
 NEON_TEXT_STYLE = {'color': '#22d3ee', 'text-shadow': '0 0 5px #06b6d4, 0 0 10px #06b6d4'}
 FUCHSIA_TEXT_STYLE = {'color': '#ec4899', 'text-shadow': '0 0 5px #d946ef, 0 0 10px #d946ef'}
 
+# Shared style for every sidebar NavLink -- one dict object reused across all
+# links rather than a fresh literal per link.
+_NAVLINK_STYLE = {
+    'color': '#22d3ee',
+    'text-shadow': '0 0 5px #06b6d4',
+    'margin-bottom': '1rem',
+    'border': '1px solid #06b6d4',
+    'border-radius': '0.5rem',
+    'transition': 'all 0.3s ease',
+    'background-color': 'rgba(6, 182, 212, 0.05)',
+}
+
 # --- LAYOUT COMPONENTS ---
 
+# NAVIGATION LINKS, built once from the page registry
+_NAV_ITEMS = [
+    dbc.NavLink(
+        html.Div([page['name']], className="ms-2 font-mono text-lg"),
+        href=page['path'],
+        active="exact",
+        # Apply custom link styling to override default dbc styles
+        style=_NAVLINK_STYLE,
+        className="hover:bg-cyan-900/40"
+    )
+    for page in dash.page_registry.values()
+]
+
 sidebar = html.Div(
     [
         # HEADER
         html.H2('VIBE CHECK OS', className='text-3xl font-extrabold mb-8 pt-4 pb-4 text-center border-b-4 border-[#06b6d4]', style=NEON_TEXT_STYLE),
         html.Hr(style={"border-color": "#d946ef"}), # Fuchsia separator
         
-        # NAVIGATION LINKS (Dynamically generated for all pages)
+        # NAVIGATION LINKS (precomputed once from the page registry)
         dbc.Nav(
-            [
-                dbc.NavLink(
-                    html.Div([page['name']], className="ms-2 font-mono text-lg"), 
-                    href=page['path'], 
-                    active="exact", 
-                    # Apply custom link styling to override default dbc styles
-                    style={
-                        'color': '#22d3ee', 
-                        'text-shadow': '0 0 5px #06b6d4',
-                        'margin-bottom': '1rem',
-                        'border': '1px solid #06b6d4',
-                        'border-radius': '0.5rem',
-                        'transition': 'all 0.3s ease',
-                        'background-color': 'rgba(6, 182, 212, 0.05)',
-                    },
-                    className="hover:bg-cyan-900/40"
-                )
-                for page in dash.page_registry.values()
-            ],
+            _NAV_ITEMS,
             vertical=True,
             pills=True,
             className="mt-5 mb-5",
@@ -0,0 +1,214 @@
+/* Clientside logic for the Live Session Dashboard.
+ *
+ * The mock score degradation, color ramp and status selection used to run as a
+ * server callback every 3 seconds. Running them here kills the HTTP round trip
+ * per tick, and Plotly.react() diffs the existing plot instead of destroying
+ * and rebuilding the SVG from a fresh `figure` payload.
+ */
+
+// Mirrors VIBE_STATUS_MAP in pages/live_dashboard.py (thresholds descending).
+var VIBE_STATUS_MAP = [
+    [80, { label: 'OPTIMAL VIBE', color: 'emerald-500', bg: 'bg-emerald-900/50' }],
+    [65, { label: 'WATCH LEVEL', color: 'yellow-500', bg: 'bg-yellow-900/50' }],
+    [50, { label: 'HIGH ALERT', color: 'orange-500', bg: 'bg-orange-900/50' }],
+    [0, { label: 'CRITICAL BREACH', color: 'red-500', bg: 'bg-red-900/50' }],
+];
+
+// Tailwind needs explicit class strings; there are only four, so build them
+// once at load (mirrors _STATUS_CLASS_CACHE on the Python side).
+VIBE_STATUS_MAP.forEach(function (entry) {
+    var s = entry[1];
+    s.className =
+        'px-3 py-1 font-bold rounded-full ' + s.bg +
+        ' text-' + s.color + ' border border-' + s.color;
+});
+
+// Color/shadow/style tables generated from pages/live_dashboard.py
+// (assets/vibe_luts.js). Indexed by the clamped integer score 0..100.
+function clampScore(score) {
+    return Math.max(0, Math.min(100, Math.floor(score)));
+}
+
+// Inclusive-low / exclusive-high integer draw, same as np.random.randint.
+function randInt(low, high) {
+    return Math.floor(Math.random() * (high - low)) + low;
+}
+
+// The mock focus level is just score + small jitter; a fixed cycle indexed by
+// the tick counter reads the same on screen without an RNG draw.
+var FOCUS_JITTER = [2, 3, 4, 3];
+
+// Layout mirroring create_predictive_graph's update_layout kwargs.
+var PREDICTIVE_LAYOUT = {
+    template: 'plotly_dark',
+    title: { text: 'ENGAGEMENT TIMELINE: ACTUAL VS. CRITICAL FORECAST (USP)', x: 0.5, font: { size: 20, color: '#e5e7eb', family: 'monospace' } },
+    height: 400,
+    plot_bgcolor: '#111827',
+    paper_bgcolor: '#1f2937',
+    font: { color: '#e5e7eb', family: 'Inter' },
+    xaxis: { title: { text: 'Time Code' } },
+    yaxis: { title: { text: 'VIBE LEVEL (%)' }, range: [50, 100] },
+    margin: { l: 40, r: 20, t: 60, b: 40 },
+};
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    vibe: {
+        update: function (n_intervals, vibe_data, graph_data) {
+            var no_update = window.dash_clientside.no_update;
+            var prev = vibe_data || {};
+
+            // 1. SCORE DEGRADATION LOGIC (randomized walk with bias)
+            var current_score = prev.current_score || 95;
+
+            var score_change = randInt(-3, 4);
+            // Slight bias towards decrease at the peak (natural fatigue)
+            if (current_score > 85 && score_change > 0) {
+                score_change = randInt(-2, 2);
+            }
+            // Strong bias towards recovery when very low (intervention effect)
+            if (current_score < 60 && score_change < 0) {
+                score_change = randInt(-1, 4);
+            }
+
+            var new_score = Math.max(30, Math.min(99, current_score + score_change));
+
+            // 2. GRAPH DATA UPDATE LOGIC (append, then trim to a moving window)
+            var time = graph_data.time.slice();
+            var actual = graph_data.actual.slice();
+
+            // The store carries an integer minute offset from 10:00, so the
+            // next label is pure arithmetic -- no string parsing per tick.
+            var mc = graph_data.minute_counter != null ? graph_data.minute_counter : time.length * 5;
+            var minutes = 10 * 60 + mc;
+            var new_time =
+                String(Math.floor(minutes / 60) % 24).padStart(2, '0') +
+                ':' +
+                String(minutes % 60).padStart(2, '0');
+            time.push(new_time);
+            actual.push(new_score);
+
+            var max_points = 20;
+            time = time.slice(-max_points);
+            actual = actual.slice(-max_points);
+
+            // Mock forecast once the score hits a critical level
+            var y_predicted = new Array(actual.length).fill(null);
+            var prediction_text = 'PREDICTED VIBE DROP: -25% in 15 minutes. HIGH DISENGAGEMENT PROTOCOL ACTIVE.';
+            var recommendation_text = 'EXECUTE GROUP HACK V2.0 NOW (5 MIN). OVERRIDE FATIGUE/RE-ENGAGE.';
+
+            if (new_score <= 70) {
+                var start = Math.max(0, actual.length - 5);
+                for (var i = start; i < actual.length; i++) {
+                    y_predicted[i] = actual[i] - 5 - (i - start) * 2;
+                }
+            } else {
+                prediction_text = 'FORECAST: STABLE. CONTINUE CURRENT PEDAGOGICAL PROTOCOL.';
+                recommendation_text = 'PROTOCOL GREEN: MONITOR VIBE SCORE.';
+            }
+
+            // 3. COLOR AND STATUS LOGIC (prebuilt style dicts, no formatting)
+            var heading_style = window.VIBE_LUTS.styles[clampScore(new_score)];
+
+            var status = VIBE_STATUS_MAP[0][1];
+            var status_threshold = 0;
+            for (var j = 0; j < VIBE_STATUS_MAP.length; j++) {
+                if (new_score >= VIBE_STATUS_MAP[j][0]) {
+                    status = VIBE_STATUS_MAP[j][1];
+                    status_threshold = VIBE_STATUS_MAP[j][0];
+                    break;
+                }
+            }
+
+            // Skip outputs whose underlying state did not change this tick:
+            // the browser then skips the prop diff/reapply for them entirely.
+            var score_same = new_score === prev.current_score;
+            var status_same = status_threshold === prev.status_threshold;
+            var forecast_mode = new_score <= 70;
+            var mode_same = forecast_mode === prev.forecast_mode;
+
+            vibe_data = {
+                current_score: new_score,
+                status_threshold: status_threshold,
+                forecast_mode: forecast_mode,
+            };
+
+            // 4. REDRAW THE PREDICTIVE GRAPH IN PLACE
+            // Steady state (no forecast before or after the tick) is a pure
+            // append: Plotly.extendTraces pushes one point and trims the
+            // window without re-laying out the chart. Only when the forecast
+            // trace appears/disappears do we fall back to a Plotly.react
+            // diff. The `figure` prop stays untouched (no_update) either way.
+            var container = document.getElementById('predictive-graph');
+            if (container && window.Plotly) {
+                var gd = container.querySelector('.js-plotly-plot') || container;
+                var has_forecast = y_predicted.some(function (v) { return v !== null; });
+                var had_forecast = gd.data && gd.data.length > 1;
+
+                if (!has_forecast && !had_forecast && gd.data) {
+                    window.Plotly.extendTraces(
+                        gd,
+                        { x: [[new_time]], y: [[new_score]] },
+                        [0],
+                        max_points
+                    );
+                } else {
+                    var traces = [{
+                        type: 'scattergl', x: time, y: actual,
+                        mode: 'lines+markers', name: 'ACTUAL VIBE LEVEL',
+                        line: { color: '#22d3ee', width: 4 },
+                        marker: { size: 8, color: '#22d3ee', line: { width: 2, color: '#1f2937' } },
+                    }];
+                    if (has_forecast) {
+                        traces.push({
+                            type: 'scattergl', x: time, y: y_predicted,
+                            mode: 'lines', name: 'CRITICAL FORECAST',
+                            line: { color: '#ec4899', width: 3, dash: 'dashdot' },
+                        });
+                    }
+                    window.Plotly.react(gd, traces, PREDICTIVE_LAYOUT);
+                }
+            }
+
+            return [
+                vibe_data,                                     // 1. Vibe Score Storage
+                { time: time, actual: actual, predicted: y_predicted, minute_counter: mc + 5 }, // 2. Graph Data Store
+                score_same ? no_update : new_score + '%',      // 3. Current Engagement Text
+                status_same ? no_update : status.label,        // 4a. Vibe Status Label
+                status_same ? no_update : status.className,    // 4b. Vibe Status ClassName
+                score_same ? no_update : heading_style,        // 5. Critical Breach Heading Style
+                no_update,                                     // 6. Figure (updated in place above)
+                (new_score + FOCUS_JITTER[n_intervals & 3]) + '%', // 7. Mock Focus Level
+                mode_same ? no_update : prediction_text,       // 8. Prediction Text
+                mode_same ? no_update : recommendation_text,   // 9. Recommendation Text
+            ];
+        },
+
+        // Pie-chart zoom toggle: clicking a slice pulls it out and widens the
+        // hole; clicking it again resets. Plotly.restyle patches just
+        // hole/pull on the mounted plot -- no figure payload, no server.
+        activity_click: function (clickData, state) {
+            var no_update = window.dash_clientside.no_update;
+            if (!clickData) {
+                return [no_update, no_update];
+            }
+
+            var clicked = clickData.points[0].pointIndex;
+            var prev = (state && state.pull_index !== undefined) ? state.pull_index : -1;
+            var new_pull = clicked === prev ? -1 : clicked;
+            var new_hole = new_pull === -1 ? 0.5 : 0.65;
+
+            var container = document.getElementById('activity-chart');
+            if (container && window.Plotly) {
+                var gd = container.querySelector('.js-plotly-plot') || container;
+                var n = (gd.data && gd.data[0].labels) ? gd.data[0].labels.length : 5;
+                var pulls = new Array(n).fill(0);
+                if (new_pull >= 0) {
+                    pulls[new_pull] = 0.1;
+                }
+                window.Plotly.restyle(gd, { hole: new_hole, pull: [pulls] }, [0]);
+            }
+
+            return [no_update, { pull_index: new_pull }];
+        },
+    },
+});
@@ -0,0 +1,720 @@
+/* Generated from the LUTs in pages/live_dashboard.py -- regenerate with:
+ *   python -c "import pages.live_dashboard as ld; ld.write_vibe_luts()"
+ * Keeps the clientside tick (assets/vibe.js) byte-identical to the
+ * Python color/shadow/style tables without recomputing them per tick.
+ */
+window.VIBE_LUTS = {
+  "colors": [
+    "#ff0000",
+    "#ff0500",
+    "#ff0a00",
+    "#ff0f00",
+    "#ff1400",
+    "#ff1900",
+    "#ff1e00",
+    "#ff2300",
+    "#ff2800",
+    "#ff2d00",
+    "#ff3300",
+    "#ff3800",
+    "#ff3d00",
+    "#ff4200",
+    "#ff4700",
+    "#ff4c00",
+    "#ff5100",
+    "#ff5600",
+    "#ff5b00",
+    "#ff6000",
+    "#ff6600",
+    "#ff6b00",
+    "#ff7000",
+    "#ff7500",
+    "#ff7a00",
+    "#ff7f00",
+    "#ff8400",
+    "#ff8900",
+    "#ff8e00",
+    "#ff9300",
+    "#ff9900",
+    "#ff9e00",
+    "#ffa300",
+    "#ffa800",
+    "#ffad00",
+    "#ffb200",
+    "#ffb700",
+    "#ffbc00",
+    "#ffc100",
+    "#ffc600",
+    "#ffcc00",
+    "#ffd100",
+    "#ffd600",
+    "#ffdb00",
+    "#ffe000",
+    "#ffe500",
+    "#ffea00",
+    "#ffef00",
+    "#fff400",
+    "#fff900",
+    "#ffff00",
+    "#f9ff00",
+    "#f4ff00",
+    "#efff00",
+    "#eaff00",
+    "#e5ff00",
+    "#e0ff00",
+    "#dbff00",
+    "#d6ff00",
+    "#d1ff00",
+    "#ccff00",
+    "#c6ff00",
+    "#c1ff00",
+    "#bcff00",
+    "#b7ff00",
+    "#b2ff00",
+    "#adff00",
+    "#a8ff00",
+    "#a3ff00",
+    "#9eff00",
+    "#99ff00",
+    "#93ff00",
+    "#8eff00",
+    "#89ff00",
+    "#84ff00",
+    "#7fff00",
+    "#7aff00",
+    "#75ff00",
+    "#70ff00",
+    "#6bff00",
+    "#66ff00",
+    "#60ff00",
+    "#5bff00",
+    "#56ff00",
+    "#51ff00",
+    "#4cff00",
+    "#47ff00",
+    "#42ff00",
+    "#3dff00",
+    "#38ff00",
+    "#32ff00",
+    "#2dff00",
+    "#28ff00",
+    "#23ff00",
+    "#1eff00",
+    "#19ff00",
+    "#14ff00",
+    "#0fff00",
+    "#0aff00",
+    "#05ff00",
+    "#00ff00"
+  ],
+  "shadows": [
+    "0 0 5px #ff0000, 0 0 10px #ff0000",
+    "0 0 5px #ff0500, 0 0 10px #ff0500",
+    "0 0 5px #ff0a00, 0 0 10px #ff0a00",
+    "0 0 5px #ff0f00, 0 0 10px #ff0f00",
+    "0 0 5px #ff1400, 0 0 10px #ff1400",
+    "0 0 5px #ff1900, 0 0 10px #ff1900",
+    "0 0 5px #ff1e00, 0 0 10px #ff1e00",
+    "0 0 5px #ff2300, 0 0 10px #ff2300",
+    "0 0 5px #ff2800, 0 0 10px #ff2800",
+    "0 0 5px #ff2d00, 0 0 10px #ff2d00",
+    "0 0 5px #ff3300, 0 0 10px #ff3300",
+    "0 0 5px #ff3800, 0 0 10px #ff3800",
+    "0 0 5px #ff3d00, 0 0 10px #ff3d00",
+    "0 0 5px #ff4200, 0 0 10px #ff4200",
+    "0 0 5px #ff4700, 0 0 10px #ff4700",
+    "0 0 5px #ff4c00, 0 0 10px #ff4c00",
+    "0 0 5px #ff5100, 0 0 10px #ff5100",
+    "0 0 5px #ff5600, 0 0 10px #ff5600",
+    "0 0 5px #ff5b00, 0 0 10px #ff5b00",
+    "0 0 5px #ff6000, 0 0 10px #ff6000",
+    "0 0 5px #ff6600, 0 0 10px #ff6600",
+    "0 0 5px #ff6b00, 0 0 10px #ff6b00",
+    "0 0 5px #ff7000, 0 0 10px #ff7000",
+    "0 0 5px #ff7500, 0 0 10px #ff7500",
+    "0 0 5px #ff7a00, 0 0 10px #ff7a00",
+    "0 0 5px #ff7f00, 0 0 10px #ff7f00",
+    "0 0 5px #ff8400, 0 0 10px #ff8400",
+    "0 0 5px #ff8900, 0 0 10px #ff8900",
+    "0 0 5px #ff8e00, 0 0 10px #ff8e00",
+    "0 0 5px #ff9300, 0 0 10px #ff9300",
+    "0 0 5px #ff9900, 0 0 10px #ff9900",
+    "0 0 5px #ff9e00, 0 0 10px #ff9e00",
+    "0 0 5px #ffa300, 0 0 10px #ffa300",
+    "0 0 5px #ffa800, 0 0 10px #ffa800",
+    "0 0 5px #ffad00, 0 0 10px #ffad00",
+    "0 0 5px #ffb200, 0 0 10px #ffb200",
+    "0 0 5px #ffb700, 0 0 10px #ffb700",
+    "0 0 5px #ffbc00, 0 0 10px #ffbc00",
+    "0 0 5px #ffc100, 0 0 10px #ffc100",
+    "0 0 5px #ffc600, 0 0 10px #ffc600",
+    "0 0 5px #ffcc00, 0 0 10px #ffcc00",
+    "0 0 5px #ffd100, 0 0 10px #ffd100",
+    "0 0 5px #ffd600, 0 0 10px #ffd600",
+    "0 0 5px #ffdb00, 0 0 10px #ffdb00",
+    "0 0 5px #ffe000, 0 0 10px #ffe000",
+    "0 0 5px #ffe500, 0 0 10px #ffe500",
+    "0 0 5px #ffea00, 0 0 10px #ffea00",
+    "0 0 5px #ffef00, 0 0 10px #ffef00",
+    "0 0 5px #fff400, 0 0 10px #fff400",
+    "0 0 5px #fff900, 0 0 10px #fff900",
+    "0 0 5px #ffff00, 0 0 10px #ffff00",
+    "0 0 5px #f9ff00, 0 0 10px #f9ff00",
+    "0 0 5px #f4ff00, 0 0 10px #f4ff00",
+    "0 0 5px #efff00, 0 0 10px #efff00",
+    "0 0 5px #eaff00, 0 0 10px #eaff00",
+    "0 0 5px #e5ff00, 0 0 10px #e5ff00",
+    "0 0 5px #e0ff00, 0 0 10px #e0ff00",
+    "0 0 5px #dbff00, 0 0 10px #dbff00",
+    "0 0 5px #d6ff00, 0 0 10px #d6ff00",
+    "0 0 5px #d1ff00, 0 0 10px #d1ff00",
+    "0 0 5px #ccff00, 0 0 10px #ccff00",
+    "0 0 5px #c6ff00, 0 0 10px #c6ff00",
+    "0 0 5px #c1ff00, 0 0 10px #c1ff00",
+    "0 0 5px #bcff00, 0 0 10px #bcff00",
+    "0 0 5px #b7ff00, 0 0 10px #b7ff00",
+    "0 0 5px #b2ff00, 0 0 10px #b2ff00",
+    "0 0 5px #adff00, 0 0 10px #adff00",
+    "0 0 5px #a8ff00, 0 0 10px #a8ff00",
+    "0 0 5px #a3ff00, 0 0 10px #a3ff00",
+    "0 0 5px #9eff00, 0 0 10px #9eff00",
+    "0 0 5px #99ff00, 0 0 10px #99ff00",
+    "0 0 5px #93ff00, 0 0 10px #93ff00",
+    "0 0 5px #8eff00, 0 0 10px #8eff00",
+    "0 0 5px #89ff00, 0 0 10px #89ff00",
+    "0 0 5px #84ff00, 0 0 10px #84ff00",
+    "0 0 5px #7fff00, 0 0 10px #7fff00",
+    "0 0 5px #7aff00, 0 0 10px #7aff00",
+    "0 0 5px #75ff00, 0 0 10px #75ff00",
+    "0 0 5px #70ff00, 0 0 10px #70ff00",
+    "0 0 5px #6bff00, 0 0 10px #6bff00",
+    "0 0 5px #66ff00, 0 0 10px #66ff00",
+    "0 0 5px #60ff00, 0 0 10px #60ff00",
+    "0 0 5px #5bff00, 0 0 10px #5bff00",
+    "0 0 5px #56ff00, 0 0 10px #56ff00",
+    "0 0 5px #51ff00, 0 0 10px #51ff00",
+    "0 0 5px #4cff00, 0 0 10px #4cff00",
+    "0 0 5px #47ff00, 0 0 10px #47ff00",
+    "0 0 5px #42ff00, 0 0 10px #42ff00",
+    "0 0 5px #3dff00, 0 0 10px #3dff00",
+    "0 0 5px #38ff00, 0 0 10px #38ff00",
+    "0 0 5px #32ff00, 0 0 10px #32ff00",
+    "0 0 5px #2dff00, 0 0 10px #2dff00",
+    "0 0 5px #28ff00, 0 0 10px #28ff00",
+    "0 0 5px #23ff00, 0 0 10px #23ff00",
+    "0 0 5px #1eff00, 0 0 10px #1eff00",
+    "0 0 5px #19ff00, 0 0 10px #19ff00",
+    "0 0 5px #14ff00, 0 0 10px #14ff00",
+    "0 0 5px #0fff00, 0 0 10px #0fff00",
+    "0 0 5px #0aff00, 0 0 10px #0aff00",
+    "0 0 5px #05ff00, 0 0 10px #05ff00",
+    "0 0 5px #00ff00, 0 0 10px #00ff00"
+  ],
+  "styles": [
+    {
+      "color": "#ff0000",
+      "text-shadow": "0 0 5px #ff0000, 0 0 10px #ff0000",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff0500",
+      "text-shadow": "0 0 5px #ff0500, 0 0 10px #ff0500",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff0a00",
+      "text-shadow": "0 0 5px #ff0a00, 0 0 10px #ff0a00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff0f00",
+      "text-shadow": "0 0 5px #ff0f00, 0 0 10px #ff0f00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff1400",
+      "text-shadow": "0 0 5px #ff1400, 0 0 10px #ff1400",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff1900",
+      "text-shadow": "0 0 5px #ff1900, 0 0 10px #ff1900",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff1e00",
+      "text-shadow": "0 0 5px #ff1e00, 0 0 10px #ff1e00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff2300",
+      "text-shadow": "0 0 5px #ff2300, 0 0 10px #ff2300",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff2800",
+      "text-shadow": "0 0 5px #ff2800, 0 0 10px #ff2800",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff2d00",
+      "text-shadow": "0 0 5px #ff2d00, 0 0 10px #ff2d00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff3300",
+      "text-shadow": "0 0 5px #ff3300, 0 0 10px #ff3300",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff3800",
+      "text-shadow": "0 0 5px #ff3800, 0 0 10px #ff3800",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff3d00",
+      "text-shadow": "0 0 5px #ff3d00, 0 0 10px #ff3d00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff4200",
+      "text-shadow": "0 0 5px #ff4200, 0 0 10px #ff4200",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff4700",
+      "text-shadow": "0 0 5px #ff4700, 0 0 10px #ff4700",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff4c00",
+      "text-shadow": "0 0 5px #ff4c00, 0 0 10px #ff4c00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff5100",
+      "text-shadow": "0 0 5px #ff5100, 0 0 10px #ff5100",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff5600",
+      "text-shadow": "0 0 5px #ff5600, 0 0 10px #ff5600",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff5b00",
+      "text-shadow": "0 0 5px #ff5b00, 0 0 10px #ff5b00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff6000",
+      "text-shadow": "0 0 5px #ff6000, 0 0 10px #ff6000",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff6600",
+      "text-shadow": "0 0 5px #ff6600, 0 0 10px #ff6600",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff6b00",
+      "text-shadow": "0 0 5px #ff6b00, 0 0 10px #ff6b00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff7000",
+      "text-shadow": "0 0 5px #ff7000, 0 0 10px #ff7000",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff7500",
+      "text-shadow": "0 0 5px #ff7500, 0 0 10px #ff7500",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff7a00",
+      "text-shadow": "0 0 5px #ff7a00, 0 0 10px #ff7a00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff7f00",
+      "text-shadow": "0 0 5px #ff7f00, 0 0 10px #ff7f00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff8400",
+      "text-shadow": "0 0 5px #ff8400, 0 0 10px #ff8400",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff8900",
+      "text-shadow": "0 0 5px #ff8900, 0 0 10px #ff8900",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff8e00",
+      "text-shadow": "0 0 5px #ff8e00, 0 0 10px #ff8e00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff9300",
+      "text-shadow": "0 0 5px #ff9300, 0 0 10px #ff9300",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff9900",
+      "text-shadow": "0 0 5px #ff9900, 0 0 10px #ff9900",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ff9e00",
+      "text-shadow": "0 0 5px #ff9e00, 0 0 10px #ff9e00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffa300",
+      "text-shadow": "0 0 5px #ffa300, 0 0 10px #ffa300",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffa800",
+      "text-shadow": "0 0 5px #ffa800, 0 0 10px #ffa800",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffad00",
+      "text-shadow": "0 0 5px #ffad00, 0 0 10px #ffad00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffb200",
+      "text-shadow": "0 0 5px #ffb200, 0 0 10px #ffb200",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffb700",
+      "text-shadow": "0 0 5px #ffb700, 0 0 10px #ffb700",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffbc00",
+      "text-shadow": "0 0 5px #ffbc00, 0 0 10px #ffbc00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffc100",
+      "text-shadow": "0 0 5px #ffc100, 0 0 10px #ffc100",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffc600",
+      "text-shadow": "0 0 5px #ffc600, 0 0 10px #ffc600",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffcc00",
+      "text-shadow": "0 0 5px #ffcc00, 0 0 10px #ffcc00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffd100",
+      "text-shadow": "0 0 5px #ffd100, 0 0 10px #ffd100",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffd600",
+      "text-shadow": "0 0 5px #ffd600, 0 0 10px #ffd600",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffdb00",
+      "text-shadow": "0 0 5px #ffdb00, 0 0 10px #ffdb00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffe000",
+      "text-shadow": "0 0 5px #ffe000, 0 0 10px #ffe000",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffe500",
+      "text-shadow": "0 0 5px #ffe500, 0 0 10px #ffe500",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffea00",
+      "text-shadow": "0 0 5px #ffea00, 0 0 10px #ffea00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffef00",
+      "text-shadow": "0 0 5px #ffef00, 0 0 10px #ffef00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#fff400",
+      "text-shadow": "0 0 5px #fff400, 0 0 10px #fff400",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#fff900",
+      "text-shadow": "0 0 5px #fff900, 0 0 10px #fff900",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ffff00",
+      "text-shadow": "0 0 5px #ffff00, 0 0 10px #ffff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#f9ff00",
+      "text-shadow": "0 0 5px #f9ff00, 0 0 10px #f9ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#f4ff00",
+      "text-shadow": "0 0 5px #f4ff00, 0 0 10px #f4ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#efff00",
+      "text-shadow": "0 0 5px #efff00, 0 0 10px #efff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#eaff00",
+      "text-shadow": "0 0 5px #eaff00, 0 0 10px #eaff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#e5ff00",
+      "text-shadow": "0 0 5px #e5ff00, 0 0 10px #e5ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#e0ff00",
+      "text-shadow": "0 0 5px #e0ff00, 0 0 10px #e0ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#dbff00",
+      "text-shadow": "0 0 5px #dbff00, 0 0 10px #dbff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#d6ff00",
+      "text-shadow": "0 0 5px #d6ff00, 0 0 10px #d6ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#d1ff00",
+      "text-shadow": "0 0 5px #d1ff00, 0 0 10px #d1ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#ccff00",
+      "text-shadow": "0 0 5px #ccff00, 0 0 10px #ccff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#c6ff00",
+      "text-shadow": "0 0 5px #c6ff00, 0 0 10px #c6ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#c1ff00",
+      "text-shadow": "0 0 5px #c1ff00, 0 0 10px #c1ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#bcff00",
+      "text-shadow": "0 0 5px #bcff00, 0 0 10px #bcff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#b7ff00",
+      "text-shadow": "0 0 5px #b7ff00, 0 0 10px #b7ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#b2ff00",
+      "text-shadow": "0 0 5px #b2ff00, 0 0 10px #b2ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#adff00",
+      "text-shadow": "0 0 5px #adff00, 0 0 10px #adff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#a8ff00",
+      "text-shadow": "0 0 5px #a8ff00, 0 0 10px #a8ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#a3ff00",
+      "text-shadow": "0 0 5px #a3ff00, 0 0 10px #a3ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#9eff00",
+      "text-shadow": "0 0 5px #9eff00, 0 0 10px #9eff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#99ff00",
+      "text-shadow": "0 0 5px #99ff00, 0 0 10px #99ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#93ff00",
+      "text-shadow": "0 0 5px #93ff00, 0 0 10px #93ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#8eff00",
+      "text-shadow": "0 0 5px #8eff00, 0 0 10px #8eff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#89ff00",
+      "text-shadow": "0 0 5px #89ff00, 0 0 10px #89ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#84ff00",
+      "text-shadow": "0 0 5px #84ff00, 0 0 10px #84ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#7fff00",
+      "text-shadow": "0 0 5px #7fff00, 0 0 10px #7fff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#7aff00",
+      "text-shadow": "0 0 5px #7aff00, 0 0 10px #7aff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#75ff00",
+      "text-shadow": "0 0 5px #75ff00, 0 0 10px #75ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#70ff00",
+      "text-shadow": "0 0 5px #70ff00, 0 0 10px #70ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#6bff00",
+      "text-shadow": "0 0 5px #6bff00, 0 0 10px #6bff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#66ff00",
+      "text-shadow": "0 0 5px #66ff00, 0 0 10px #66ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#60ff00",
+      "text-shadow": "0 0 5px #60ff00, 0 0 10px #60ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#5bff00",
+      "text-shadow": "0 0 5px #5bff00, 0 0 10px #5bff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#56ff00",
+      "text-shadow": "0 0 5px #56ff00, 0 0 10px #56ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#51ff00",
+      "text-shadow": "0 0 5px #51ff00, 0 0 10px #51ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#4cff00",
+      "text-shadow": "0 0 5px #4cff00, 0 0 10px #4cff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#47ff00",
+      "text-shadow": "0 0 5px #47ff00, 0 0 10px #47ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#42ff00",
+      "text-shadow": "0 0 5px #42ff00, 0 0 10px #42ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#3dff00",
+      "text-shadow": "0 0 5px #3dff00, 0 0 10px #3dff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#38ff00",
+      "text-shadow": "0 0 5px #38ff00, 0 0 10px #38ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#32ff00",
+      "text-shadow": "0 0 5px #32ff00, 0 0 10px #32ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#2dff00",
+      "text-shadow": "0 0 5px #2dff00, 0 0 10px #2dff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#28ff00",
+      "text-shadow": "0 0 5px #28ff00, 0 0 10px #28ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#23ff00",
+      "text-shadow": "0 0 5px #23ff00, 0 0 10px #23ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#1eff00",
+      "text-shadow": "0 0 5px #1eff00, 0 0 10px #1eff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#19ff00",
+      "text-shadow": "0 0 5px #19ff00, 0 0 10px #19ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#14ff00",
+      "text-shadow": "0 0 5px #14ff00, 0 0 10px #14ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#0fff00",
+      "text-shadow": "0 0 5px #0fff00, 0 0 10px #0fff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#0aff00",
+      "text-shadow": "0 0 5px #0aff00, 0 0 10px #0aff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#05ff00",
+      "text-shadow": "0 0 5px #05ff00, 0 0 10px #05ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    },
+    {
+      "color": "#00ff00",
+      "text-shadow": "0 0 5px #00ff00, 0 0 10px #00ff00",
+      "transition": "color 0.5s ease, text-shadow 0.5s ease"
+    }
+  ]
+};
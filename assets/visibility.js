@@ -0,0 +1,11 @@
+/* Pauses the live-dashboard polling while the tab is backgrounded.
+ *
+ * The visibility change is pushed into the tab-hidden-store via set_props;
+ * a clientside callback in pages/live_dashboard.py maps it onto
+ * vibe-interval.disabled, so hidden tabs stop ticking entirely.
+ */
+document.addEventListener('visibilitychange', function () {
+    if (window.dash_clientside && window.dash_clientside.set_props) {
+        window.dash_clientside.set_props('tab-hidden-store', { data: document.hidden });
+    }
+});
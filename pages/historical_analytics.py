@@ -1,9 +1,9 @@
 import dash
+import functools
 from dash import dcc, html, dash_table
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
 
 # Register the page, defining the URL path
 dash.register_page(__name__, path='/analytics', name='Historical Analytics')
@@ -21,6 +21,11 @@ attendance_data = {
 df_attendance = pd.DataFrame(attendance_data)
 df_attendance.index.name = 'Index'
 
+# The attendance log is static mock data, so the DataTable records and column
+# specs are converted once here rather than on every layout build.
+_ATTENDANCE_RECORDS = df_attendance.to_dict('records')
+_ATTENDANCE_COLUMNS = [{"name": i, "id": i} for i in df_attendance.columns]
+
 # --- STYLING (Enhanced for extreme cyber look) ---
 CYBER_CARD_STYLE = {
     'background-color': '#1f2937', # Dark Card Base
@@ -44,12 +49,12 @@ CYBER_EMBEDDED_STYLE = {
 
 # --- COMPONENTS ---
 
-def create_attendance_table(df):
+def create_attendance_table():
     """Creates a Dash DataTable for attendance logs with cyber theme styling."""
     return dash_table.DataTable(
         id='attendance-log-table',
-        columns=[{"name": i, "id": i} for i in df.columns],
-        data=df.to_dict('records'),
+        columns=_ATTENDANCE_COLUMNS,
+        data=_ATTENDANCE_RECORDS,
         style_header={
             'backgroundColor': '#0b0f15', # Very dark header
             'color': '#22d3ee',
@@ -63,7 +68,11 @@ def create_attendance_table(df):
             'borderBottom': '1px solid #374151',
             'fontFamily': 'monospace'
         },
-        style_table={'overflowX': 'auto', 'border': 'none'},
+        style_table={'height': '400px', 'overflowY': 'auto', 'overflowX': 'auto', 'border': 'none'},
+        # Virtualized rows keep the DOM constant-size as the session log grows
+        # past the mock rows; page_action='none' is required for virtualization.
+        virtualization=True,
+        fixed_rows={'headers': True},
         page_action='none',
         sort_action='native',
         filter_action='native'
@@ -89,9 +98,13 @@ def create_strategy_graph_placeholder():
     )
     return fig
 
+# Both placeholder slots show the identical figure, so build (and serialize)
+# it once instead of per dcc.Graph per page load.
+_PLACEHOLDER_FIG = create_strategy_graph_placeholder()
+
 # --- PAGE LAYOUT ---
 
-layout = html.Div([
+_LAYOUT = html.Div([
     dbc.Row([
         # Main Title Header
         dbc.Col(
@@ -119,7 +132,7 @@ layout = html.Div([
                     ),
                     # Placeholder for the main Curriculum Bar Chart
                     html.Div(dcc.Graph(
-                        figure=create_strategy_graph_placeholder(),
+                        figure=_PLACEHOLDER_FIG,
                         config={'displayModeBar': False}
                     ), style=CYBER_EMBEDDED_STYLE)
                 ]),
@@ -131,7 +144,7 @@ layout = html.Div([
                 html.H3('PEDAGOGICAL STRATEGY COMPARISON', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
                 html.P('Compare engagement outcomes for different instructional methods.', className='text-gray-400 mb-4'),
                 html.Div(dcc.Graph(
-                    figure=create_strategy_graph_placeholder(), # Reusing the placeholder function
+                    figure=_PLACEHOLDER_FIG, # Reusing the cached placeholder figure
                     config={'displayModeBar': False}
                 ), style=CYBER_EMBEDDED_STYLE)
             ], style=CYBER_CARD_STYLE),
@@ -161,8 +174,19 @@ layout = html.Div([
             dbc.Card([
                 html.H3('AUTOMATED ATTENDANCE LOGS', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
                 html.P('Fulfilling the core requirement with objective face-recognition data.', className='text-gray-400 mb-4'),
-                html.Div(create_attendance_table(df_attendance), style=CYBER_EMBEDDED_STYLE)
+                html.Div(create_attendance_table(), style=CYBER_EMBEDDED_STYLE)
             ], style={**CYBER_CARD_STYLE, 'boxShadow': '0 0 15px rgba(236, 72, 153, 0.4)'}), # Fuchsia specific glow
         ], md=4, className="mb-4"),
     ])
 ])
+
+
+# Dash re-serializes the page layout for every new session; handing it the
+# same cached component instance lets that traversal reuse one object tree
+# instead of rebuilding hundreds of component objects per navigation.
+@functools.lru_cache(maxsize=1)
+def get_layout():
+    return _LAYOUT
+
+
+layout = get_layout()
@@ -1,10 +1,19 @@
+"""Live Session Dashboard page.
+
+Performance note: keep `orjson` in requirements -- Dash auto-switches its
+callback/layout serialization to it when importable, which matters for the
+figure-sized payloads this page serves on load.
+"""
+import bisect
 import dash
+import functools
+import random
 from dash import dcc, html
-from dash.dependencies import Input, Output, State
+from dash.dependencies import ClientsideFunction, Input, Output, State
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import pandas as pd
 import numpy as np
+from numba import njit, prange
 
 # Register the page in the multi-page framework
 dash.register_page(__name__, path='/', name='Live Session Dashboard') 
@@ -21,6 +30,23 @@ VIBE_STATUS_MAP = {
     0: {'label': 'CRITICAL BREACH', 'color': 'red-500', 'bg': 'bg-red-900/50'},
 }
 
+# The status map never changes after import, so flatten it once into
+# ascending parallel tuples and resolve a score with a single bisect --
+# no re-sorting, no linear scan, no className formatting per lookup.
+_ASC_THRESHOLDS = tuple(sorted(VIBE_STATUS_MAP))
+_ASC_STATUSES = tuple(VIBE_STATUS_MAP[t] for t in _ASC_THRESHOLDS)
+_STATUS_CLASS_CACHE = {
+    k: f'px-3 py-1 font-bold rounded-full {v["bg"]} text-{v["color"]} border border-{v["color"]}'
+    for k, v in VIBE_STATUS_MAP.items()
+}
+_ASC_STATUS_CLASSES = tuple(_STATUS_CLASS_CACHE[t] for t in _ASC_THRESHOLDS)
+
+
+def get_status_from_score(score):
+    """Returns (status dict, className) for a score via the precomputed thresholds."""
+    idx = max(0, bisect.bisect_right(_ASC_THRESHOLDS, score) - 1)
+    return _ASC_STATUSES[idx], _ASC_STATUS_CLASSES[idx]
+
 # Custom Styles
 CYBER_CARD_STYLE = {
     'background-color': '#1f2937',
@@ -35,12 +61,10 @@ FUCHSIA_TEXT_STYLE = {'color': '#ec4899', 'text-shadow': '0 0 5px #d946ef, 0 0 1
 
 
 # --- UTILITY: COLOR MAPPING FUNCTION ---
-def get_color_from_score(score):
+def _compute_color(score):
     """Maps score (0-100) to a hex color: Green(100) -> Yellow(50) -> Red(0)"""
-    score = max(0, min(100, score)) # Clamp score between 0 and 100
-    
     # Invert score so 0 is red and 100 is green
-    r, g, b = 0, 0, 0
+    r, g = 0, 0
     if score >= 50:
         # Green to Yellow (Score 50 to 100)
         ratio = (score - 50) / 50.0  # 0 to 1
@@ -53,30 +77,152 @@ def get_color_from_score(score):
         g = int(255 * ratio)
 
     # Simple scaling for extreme cyber look (full 255 range looks better with dark background)
-    return f'#{r:02x}{g:02x}00' 
+    return f'#{r:02x}{g:02x}00'
+
+# The score domain is a clamped integer 0..100, so precompute the full output
+# space once at import: color, glow shadow, and the ready-to-return heading
+# style dict. A lookup is all that remains on the hot path (and a bulk
+# learner-trend recolor can index straight into these).
+_COLOR_LUT = tuple(_compute_color(i) for i in range(101))
+_SHADOW_LUT = tuple(f'0 0 5px {c}, 0 0 10px {c}' for c in _COLOR_LUT)
+_STYLE_LUT = tuple(
+    {
+        'color': _COLOR_LUT[i],
+        'text-shadow': _SHADOW_LUT[i],
+        'transition': 'color 0.5s ease, text-shadow 0.5s ease',
+    }
+    for i in range(101)
+)
+
+
+def get_color_from_score(score):
+    """Maps score (0-100) to a hex color: Green(100) -> Yellow(50) -> Red(0)"""
+    return _COLOR_LUT[max(0, min(100, int(score)))]
+
+
+# Bulk recoloring path: once the learner-trend panel grows to hundreds of
+# learners x sessions, looping get_color_from_score in Python dominates.
+# The ramp is jitted (cache=True persists the compiled kernel across
+# restarts) and hex formatting happens only at the Python boundary.
+@njit(cache=True)
+def _score_to_rgb(score):
+    score = max(0.0, min(100.0, score))
+    if score >= 50.0:
+        ratio = (score - 50.0) / 50.0
+        return np.uint8(255 * (1 - ratio)), np.uint8(255)
+    ratio = score / 50.0
+    return np.uint8(255), np.uint8(255 * ratio)
+
+
+@njit(cache=True, parallel=True)
+def _scores_to_rgb(scores):
+    out = np.empty((scores.shape[0], 3), dtype=np.uint8)
+    for i in prange(scores.shape[0]):
+        r, g = _score_to_rgb(scores[i])
+        out[i, 0] = r
+        out[i, 1] = g
+        out[i, 2] = 0
+    return out
+
+
+def scores_to_hex(scores):
+    """Vectorized get_color_from_score: maps an array of scores to hex colors."""
+    rgb = _scores_to_rgb(np.asarray(scores, dtype=np.float64))
+    return [f'#{r:02x}{g:02x}00' for r, g in rgb[:, :2]]
+
+
+def write_vibe_luts(path=None):
+    """Regenerates assets/vibe_luts.js so the clientside tick shares these LUTs."""
+    import json
+    import os
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'vibe_luts.js')
+    header = (
+        '/* Generated from the LUTs in pages/live_dashboard.py -- regenerate with:\n'
+        ' *   python -c "import pages.live_dashboard as ld; ld.write_vibe_luts()"\n'
+        ' * Keeps the clientside tick (assets/vibe.js) byte-identical to the\n'
+        ' * Python color/shadow/style tables without recomputing them per tick.\n'
+        ' */\n'
+    )
+    luts = {'colors': _COLOR_LUT, 'shadows': _SHADOW_LUT, 'styles': _STYLE_LUT}
+    with open(path, 'w') as f:
+        f.write(header + 'window.VIBE_LUTS = %s;\n' % json.dumps(luts, indent=2))
 
 # --- PLOTLY GRAPHIC FUNCTIONS ---
 
-# Initial Mock Data: 
+# Initial Mock Data:
 # We use dcc.Store to hold the *current* state of the graph data for persistent updates.
-initial_time_labels = pd.date_range('10:00', periods=10, freq='5min').strftime('%H:%M')
-initial_engagement = list(np.random.randint(85, 95, 10))
+# Plain Python generation keeps NumPy/pandas work off the import path of
+# every worker; the labels are 5-minute steps from 10:00.
+initial_time_labels = [f'{10 + (i * 5) // 60:02d}:{(i * 5) % 60:02d}' for i in range(10)]
+initial_engagement = [random.randint(85, 94) for _ in range(10)]
 
 # This data store holds the graph's history
 GRAPH_DATA_STORE_ID = 'predictive-graph-data'
 
 
-def create_predictive_graph(x_data, y_actual, y_predicted):
+# Cap on points handed to the renderer. Full-session history is downsampled
+# to this budget before it reaches the figure, bounding both the serialized
+# payload and the client draw work regardless of session length.
+MAX_RENDER_POINTS = 500
+
+
+def downsample_lttb(x_data, y_data, n_out=MAX_RENDER_POINTS):
+    """Largest-Triangle-Three-Buckets downsample of (x, y) to n_out points.
+
+    Keeps the first and last point and, per bucket, the point forming the
+    largest triangle with its neighbours -- preserving visual peaks/troughs
+    that uniform striding would drop.
+    """
+    n = len(y_data)
+    if n <= n_out or n_out < 3:
+        return list(x_data), list(y_data)
+
+    ys = np.asarray(y_data, dtype=np.float64)
+    xs = np.arange(n, dtype=np.float64)  # positional x; labels are categorical
+    every = (n - 2) / (n_out - 2)
+
+    idxs = [0]
+    a = 0
+    for i in range(n_out - 2):
+        # Average of the next bucket (the "third point" of the triangle)
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = xs[avg_start:avg_end].mean()
+        avg_y = ys[avg_start:avg_end].mean()
+
+        # Pick the point in the current bucket with the largest triangle area
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (ys[a] - avg_y)
+        )
+        a = start + int(np.argmax(area))
+        idxs.append(a)
+
+    idxs.append(n - 1)
+    return [x_data[i] for i in idxs], [y_data[i] for i in idxs]
+
+
+def create_predictive_graph(x_data, y_actual, y_predicted, show_forecast=False):
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    # The forecast trace keeps the raw axis labels; only the dense actual
+    # trace needs downsampling.
+    x_forecast = x_data
+    if len(y_actual) > MAX_RENDER_POINTS:
+        x_data, y_actual = downsample_lttb(x_data, y_actual)
+    # Scattergl renders via WebGL: one draw call instead of per-point SVG
+    # nodes, so the timeline stays interactive as session history grows.
+    fig.add_trace(go.Scattergl(
         x=x_data, y=y_actual, mode='lines+markers', name='ACTUAL VIBE LEVEL',
         line=dict(color='#22d3ee', width=4), marker=dict(size=8, color='#22d3ee', line=dict(width=2, color='#1f2937'))
     ))
     
-    # Only plot prediction if it's not all None
-    if any(y_predicted):
-        fig.add_trace(go.Scatter(
-            x=x_data, y=y_predicted, mode='lines', name='CRITICAL FORECAST',
+    # The caller knows whether a forecast is active; no need to scan the list
+    if show_forecast:
+        fig.add_trace(go.Scattergl(
+            x=x_forecast, y=y_predicted, mode='lines', name='CRITICAL FORECAST',
             line=dict(color='#ec4899', width=3, dash='dashdot'),
         ))
         
@@ -90,25 +236,25 @@ def create_predictive_graph(x_data, y_actual, y_predicted):
     return fig
 
 # Initial Activity Data and Graph Creator (for Donut Chart)
-initial_activity_data = {
-    'Activity': ['Productive Group Work', 'Facilitator Lecture', 'Structured Practical', 'Distractive Chaos', 'Individual Quiet Work'],
-    'Duration': [22, 15, 8, 3, 5]
-}
-df_activity = pd.DataFrame(initial_activity_data)
+# Plain tuples: 5 static rows never justified a DataFrame, and tuple access
+# skips the per-call pandas Series allocation the column lookups paid.
+_ACTIVITY_LABELS = ('Productive Group Work', 'Facilitator Lecture', 'Structured Practical', 'Distractive Chaos', 'Individual Quiet Work')
+_ACTIVITY_VALUES = (22, 15, 8, 3, 5)
+_ZERO_PULL = (0.0,) * len(_ACTIVITY_LABELS)
 
 def create_activity_graph(hole_size=0.5, colors=None, pull_index=None):
-    
+
     # Define custom cyber colors
     cyber_colors = colors if colors else ['#10b981', '#6366f1', '#22d3ee', '#ef4444', '#9ca3af']
-    
+
     # Calculate pull list for exploded view effect
-    pull_list = [0.0] * len(df_activity)
+    pull_list = list(_ZERO_PULL)
     if pull_index is not None:
         pull_list[pull_index] = 0.1 # Pull the selected slice out
 
     fig = go.Figure(data=[go.Pie(
-        labels=df_activity['Activity'], 
-        values=df_activity['Duration'], 
+        labels=_ACTIVITY_LABELS,
+        values=_ACTIVITY_VALUES,
         hole=hole_size, # Dynamic hole size
         marker=dict(colors=cyber_colors, line=dict(color='#111827', width=2)),
         textinfo='percent+label',
@@ -128,16 +274,24 @@ def create_activity_graph(hole_size=0.5, colors=None, pull_index=None):
     
     return fig
 
+# Initial figures are invariant across sessions: build them once at import so
+# each page load reuses the same already-constructed Figure objects.
+_PREDICTIVE_FIG = create_predictive_graph(initial_time_labels, initial_engagement, [None] * len(initial_engagement))
+_ACTIVITY_FIG = create_activity_graph()
+
 # --- PAGE LAYOUT ---
 
-layout = html.Div([
+_LAYOUT = html.Div([
     # Store to hold the degrading Vibe Score for text updates
     dcc.Store(id='vibe-score-storage', data={'current_score': MOCK_VIBE_SCORE}),
     # Store to hold the graph's historical data
     dcc.Store(id=GRAPH_DATA_STORE_ID, data={
-        'time': list(initial_time_labels), 
-        'actual': initial_engagement, 
-        'predicted': [None] * len(initial_engagement)
+        'time': list(initial_time_labels),
+        'actual': initial_engagement,
+        'predicted': [None] * len(initial_engagement),
+        # Minute offset (from 10:00) of the next point -- the tick derives the
+        # next HH:MM label from this integer instead of parsing the last label.
+        'minute_counter': len(initial_engagement) * 5
     }),
     # Hidden interval to trigger the mock degradation every 3 seconds (3000 ms)
     dcc.Interval(id='vibe-interval', interval=3000, n_intervals=0),
@@ -145,6 +299,10 @@ layout = html.Div([
     # Store to hold the state of the donut chart (clicked slice)
     dcc.Store(id='activity-chart-state', data={'pull_index': -1}),
 
+    # Written by assets/visibility.js on visibilitychange; drives the
+    # interval's disabled prop so hidden tabs stop ticking
+    dcc.Store(id='tab-hidden-store', data=False),
+
 
     dbc.Row([
         # Main Title Header (Inside the content area)
@@ -204,7 +362,7 @@ layout = html.Div([
             dbc.Card([
                 dcc.Graph(
                     id='predictive-graph',
-                    figure=create_predictive_graph(initial_time_labels, initial_engagement, [None] * len(initial_engagement)),
+                    figure=_PREDICTIVE_FIG,
                     config={'displayModeBar': False}
                 ),
             ], style={**CYBER_CARD_STYLE, 'height': '100%'}),
@@ -220,7 +378,7 @@ layout = html.Div([
                 html.H2('ACTIVITY HASHMAP [LAST 30 CYCLES]', className='text-xl font-mono font-bold text-gray-300 mb-4 border-b border-gray-700 pb-2'),
                 dcc.Graph(
                     id='activity-chart',
-                    figure=create_activity_graph(),
+                    figure=_ACTIVITY_FIG,
                     config={'displayModeBar': False},
                     style={'height': '350px'}
                 ),
@@ -255,9 +413,25 @@ layout = html.Div([
 ])
 
 
+# Dash re-serializes the page layout for every new session; handing it the
+# same cached component instance lets that traversal reuse one object tree
+# instead of rebuilding hundreds of component objects per navigation.
+@functools.lru_cache(maxsize=1)
+def get_layout():
+    return _LAYOUT
+
+
+layout = get_layout()
+
 # --- CALLBACKS FOR DYNAMIC COLOR, SCORE, AND GRAPH UPDATE ---
 
-@dash.callback(
+# The per-tick update runs entirely in the browser (assets/vibe.js). This
+# removes the 3s server round trip, and the JS side redraws the predictive
+# graph with Plotly.react() -- which diffs the mounted plot -- instead of
+# shipping a freshly built `figure` dict over the wire. The dcc.Store
+# components remain the source of truth for score and graph history.
+dash.clientside_callback(
+    ClientsideFunction(namespace='vibe', function_name='update'),
     [
         Output('vibe-score-storage', 'data'),
         Output(GRAPH_DATA_STORE_ID, 'data'),
@@ -278,145 +452,24 @@ layout = html.Div([
         State(GRAPH_DATA_STORE_ID, 'data')
     ]
 )
-def update_vibe_score_and_color(n_intervals, vibe_data, graph_data):
-    
-    # 1. SCORE DEGRADATION LOGIC
-    current_score = vibe_data.get('current_score', MOCK_VIBE_SCORE)
-    
-    # --- MODIFIED LOGIC: RANDOMIZED SCORE CHANGE ---
-    
-    # Generate a random change (increase or decrease)
-    # Range: -3 to +3 points. This keeps it dynamic.
-    score_change = np.random.randint(-3, 4) 
-    
-    # Apply a slight bias towards decrease if score is high (simulating natural fatigue)
-    if current_score > 85 and score_change > 0:
-        score_change = np.random.randint(-2, 2) # Reduce likelihood of large gains at peak
-        
-    # Apply a strong bias towards increase if score is very low (simulating intervention effect)
-    if current_score < 60 and score_change < 0:
-        score_change = np.random.randint(-1, 4) # Increase likelihood of recovery
-    
-    new_score = current_score + score_change
-    
-    # Clamp score between 30 and 99 (for a realistic range)
-    new_score = max(30, min(99, new_score))
-        
-    vibe_data['current_score'] = new_score
-    
-    # 2. GRAPH DATA UPDATE LOGIC
-    
-    # Determine the next time label
-    if graph_data['time']:
-        last_time_str = graph_data['time'][-1]
-        last_time = pd.to_datetime(last_time_str, format='%H:%M')
-        new_time = (last_time + pd.Timedelta(minutes=5)).strftime('%H:%M')
-    else:
-        new_time = '10:00'
-    
-    # Append new data point
-    graph_data['time'].append(new_time)
-    graph_data['actual'].append(new_score)
-    
-    # Trim the data to show only the last 20 points for a moving window
-    max_points = 20
-    graph_data['time'] = graph_data['time'][-max_points:]
-    graph_data['actual'] = graph_data['actual'][-max_points:]
-    
-    # Create mock prediction for the next few points if the score drops low
-    y_predicted = [None] * len(graph_data['actual'])
-    
-    prediction_text = 'PREDICTED VIBE DROP: -25% in 15 minutes. HIGH DISENGAGEMENT PROTOCOL ACTIVE.'
-    recommendation_text = 'EXECUTE GROUP HACK V2.0 NOW (5 MIN). OVERRIDE FATIGUE/RE-ENGAGE.'
-    
-    if new_score <= 70: # Start prediction when score hits a critical level
-        
-        # Start prediction 5 points before the end
-        prediction_start_index = max(0, len(graph_data['actual']) - 5)
-        
-        # Simulate a drop forecast: 1 point lower than current for the next 3 points
-        mock_forecast = [score - 5 - i*2 for i, score in enumerate(graph_data['actual'][prediction_start_index:])]
-        
-        # Merge actual and prediction list
-        for i in range(len(mock_forecast)):
-            index = prediction_start_index + i
-            if index < len(y_predicted):
-                y_predicted[index] = mock_forecast[i]
-                
-    else:
-        prediction_text = 'FORECAST: STABLE. CONTINUE CURRENT PEDAGOGICAL PROTOCOL.'
-        recommendation_text = 'PROTOCOL GREEN: MONITOR VIBE SCORE.'
 
-    # 3. COLOR AND STATUS LOGIC
-    
-    # Calculate Dynamic Color
-    dynamic_color = get_color_from_score(new_score)
-    dynamic_shadow = f'0 0 5px {dynamic_color}, 0 0 10px {dynamic_color}'
-    
-    # Update Heading Style
-    new_heading_style = {
-        'color': dynamic_color, 
-        'text-shadow': dynamic_shadow, 
-        'transition': 'color 0.5s ease, text-shadow 0.5s ease'
-    }
-    
-    # Determine Vibe Status Label and Class
-    status_data = VIBE_STATUS_MAP[80] 
-    for threshold, status in sorted(VIBE_STATUS_MAP.items(), reverse=True):
-        if new_score >= threshold:
-            status_data = status
-            break
-            
-    # Format Vibe Status ClassName (Tailwind requires explicit class strings)
-    status_class = f'px-3 py-1 font-bold rounded-full {status_data["bg"]} text-{status_data["color"]} border border-{status_data["color"]}'
-    
-    # Recreate the figure with the new data
-    new_figure = create_predictive_graph(graph_data['time'], graph_data['actual'], y_predicted)
-    
-    # 4. RETURN ALL UPDATED VALUES
-    return (
-        vibe_data, # 1. Vibe Score Storage
-        graph_data, # 2. Graph Data Store
-        f'{new_score}%', # 3. Current Engagement Text
-        status_data['label'], # 4a. Vibe Status Label
-        status_class, # 4b. Vibe Status ClassName
-        new_heading_style, # 5. Critical Breach Heading Style
-        new_figure, # 6. Predictive Graph Figure
-        f'{new_score + np.random.randint(2, 5)}%', # 7. Mock Focus Level
-        prediction_text, # 8. Prediction Text
-        recommendation_text # 9. Recommendation Text
-    )
+# Hidden tabs should not tick at all: mirror the visibility flag (written by
+# assets/visibility.js) onto the interval's disabled prop.
+dash.clientside_callback(
+    "function(hidden) { return !!hidden; }",
+    Output('vibe-interval', 'disabled'),
+    Input('tab-hidden-store', 'data')
+)
 
 # --- NEW CALLBACK FOR INTERACTIVE PIE CHART (ZOOM EFFECT) ---
-@dash.callback(
+
+# The zoom toggle is a trivial state flip, so it runs in the browser
+# (assets/vibe.js): Plotly.restyle patches hole/pull on the mounted pie with
+# zero network traffic, and the store keeps the click-again-to-reset state.
+dash.clientside_callback(
+    ClientsideFunction(namespace='vibe', function_name='activity_click'),
     Output('activity-chart', 'figure'),
+    Output('activity-chart-state', 'data'),
     [Input('activity-chart', 'clickData')],
     [State('activity-chart-state', 'data')]
 )
-def update_activity_graph(clickData, state):
-    
-    # Default to the initial graph if no click data or click data is reset
-    if not clickData or (state.get('pull_index', -1) != -1 and not clickData):
-        # Reset graph state and figure (no pull, default hole size)
-        new_pull_index = -1
-        state['pull_index'] = new_pull_index
-        return create_activity_graph(hole_size=0.5, pull_index=new_pull_index)
-        
-    # Determine the index of the clicked slice
-    clicked_index = clickData['points'][0]['pointIndex']
-    
-    # Check if the same slice was clicked twice (to trigger zoom-out/reset)
-    if clicked_index == state.get('pull_index', -1):
-        # Zoom out / Reset
-        new_pull_index = -1
-        new_hole_size = 0.5
-    else:
-        # Zoom in / Select new slice
-        new_pull_index = clicked_index
-        new_hole_size = 0.65 # Make the hole larger for a dramatic zoom effect
-    
-    # Update the stored state for the next call
-    state['pull_index'] = new_pull_index
-    
-    # Return the new figure
-    return create_activity_graph(hole_size=new_hole_size, pull_index=new_pull_index)
@@ -1,5 +1,7 @@
 import dash
-from dash import dcc, html, dash_table
+import functools
+import zlib
+from dash import dcc, html, dash_table, Patch
 from dash.dependencies import Input, Output
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
@@ -11,23 +13,41 @@ dash.register_page(__name__, path='/students', name='Student Analytics')
 
 # --- MOCK DATA FOR STUDENT ANALYTICS ---
 
-# Generate mock data for a class of 20 students
-np.random.seed(42) # for reproducibility
-student_data = {
-    'Student_ID': [f'L-{i:02d}' for i in range(1, 21)],
-    'Vibe_Score': np.random.randint(40, 95, 20),
-    'Sessions_Attended': np.random.randint(5, 15, 20),
-    'Alert_Count': np.random.randint(0, 5, 20)
-}
-df_students = pd.DataFrame(student_data)
-
-# Mock historical data for a selected student
+# Dash imports every page module at startup, so the roster is built lazily on
+# first visit instead of paying the numpy/pandas work at app import.
+@functools.cache
+def _get_df_students():
+    """Mock class roster for 20 students (seeded for reproducibility)."""
+    np.random.seed(42)
+    student_data = {
+        'Student_ID': [f'L-{i:02d}' for i in range(1, 21)],
+        'Vibe_Score': np.random.randint(40, 95, 20),
+        'Sessions_Attended': np.random.randint(5, 15, 20),
+        'Alert_Count': np.random.randint(0, 5, 20)
+    }
+    df = pd.DataFrame(student_data)
+    # Pre-bucketed styling class: the table styles rows by equality on this
+    # field instead of re-evaluating range filter queries per row per render.
+    df['_Bucket'] = np.where(df['Vibe_Score'] <= 60, 'low',
+                             np.where(df['Vibe_Score'] <= 75, 'mid', 'ok'))
+    return df
+
+# Mock historical data for a selected student.
+# The date axis is the same for everyone, so build it once on first use (not
+# at import); scores are seeded from the student ID so a learner's history is
+# stable across clicks (the old per-click np.random re-roll showed a
+# different history every selection).
+@functools.cache
+def _get_history_dates():
+    return [d.strftime('%Y-%m-%d') for d in pd.date_range('2025-09-01', periods=10, freq='D')]
+
+
+@functools.lru_cache(maxsize=32)
 def get_historical_data(student_id):
-    days = 10
-    return pd.DataFrame({
-        'Date': pd.to_datetime(pd.date_range('2025-09-01', periods=days, freq='D')),
-        'Vibe_Score': np.random.randint(55, 95, days)
-    })
+    """Returns (dates, scores) for a learner; deterministic and cached per ID."""
+    dates = _get_history_dates()
+    rng = np.random.RandomState(zlib.crc32(student_id.encode()))
+    return dates, tuple(int(s) for s in rng.randint(55, 95, len(dates)))
 
 # --- STYLING COMPONENTS (Consistent with the Cyber Theme) ---
 
@@ -72,65 +92,115 @@ TABLE_STYLE_CELL = {
 }
 
 
+# Base figure for the historical graph, built once at import: an empty styled
+# trace plus the "awaiting selection" annotation. Selection callbacks Patch
+# x/y/title onto this instead of shipping a rebuilt figure per click.
+_AWAITING_ANNOTATION = {
+    'text': "[AWAITING LEARNER SELECTION]",
+    'xref': "paper", 'yref': "paper", 'x': 0.5, 'y': 0.5,
+    'showarrow': False,
+    'font': {'size': 18, 'color': '#ec4899', 'family': 'monospace'}
+}
+
+
+def _create_base_student_fig():
+    fig = go.Figure(
+        data=go.Scatter(
+            x=[], y=[],
+            mode='lines+markers',
+            line={'color': '#22d3ee', 'width': 4},
+            marker={'size': 10, 'color': '#22d3ee'}
+        )
+    )
+    fig.update_layout(
+        template='plotly_dark',
+        paper_bgcolor='#111827',
+        plot_bgcolor='#111827',
+        annotations=[_AWAITING_ANNOTATION],
+        xaxis={'title': 'Date', 'showgrid': False, 'visible': False},
+        yaxis={'title': 'Vibe Score', 'range': [0, 100], 'visible': False}
+    )
+    return fig
+
+
+_BASE_STUDENT_FIG = _create_base_student_fig()
+
 # --- PAGE LAYOUT ---
 
-layout = html.Div([
-    dbc.Row([
-        # Main Title Header
-        dbc.Col(
-            html.H1('INDIVIDUAL LEARNER ANALYTICS // TARGETED INTERVENTION', 
-                    className="text-4xl font-extrabold mb-8 pb-4 border-b-4 border-gray-700", 
-                    style=NEON_TEXT_STYLE),
-            width=12
-        ),
-    ]),
-
-    # Main content row with a table and a graph
-    dbc.Row([
-        # COLUMN 1: Student List Table (Slightly narrower for better fit)
-        dbc.Col([
-            dbc.Card([
-                html.H3('VIBE SCORES // CLASS RUNDOWN', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
-                html.P('Click a student ID to view their historical progress. Low scores are highlighted.', className='text-gray-400 mb-4'),
-                dash_table.DataTable(
-                    id='student-table',
-                    columns=[{"name": i.replace('_', ' ').title(), "id": i} for i in df_students.columns],
-                    data=df_students.to_dict('records'),
+# The layout is a callable so Dash builds it on page visit, not at import --
+# the first call materializes the roster; later visits reuse the cached tree.
+@functools.cache
+def _build_layout():
+    df_students = _get_df_students()
+    return html.Div([
+        dbc.Row([
+            # Main Title Header
+            dbc.Col(
+                html.H1('INDIVIDUAL LEARNER ANALYTICS // TARGETED INTERVENTION', 
+                        className="text-4xl font-extrabold mb-8 pb-4 border-b-4 border-gray-700", 
+                        style=NEON_TEXT_STYLE),
+                width=12
+            ),
+        ]),
+
+        # Main content row with a table and a graph
+        dbc.Row([
+            # COLUMN 1: Student List Table (Slightly narrower for better fit)
+            dbc.Col([
+                dbc.Card([
+                    html.H3('VIBE SCORES // CLASS RUNDOWN', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
+                    html.P('Click a student ID to view their historical progress. Low scores are highlighted.', className='text-gray-400 mb-4'),
+                    dash_table.DataTable(
+                        id='student-table',
+                        # Underscore-prefixed fields ride along in the data for
+                        # styling but are not rendered as columns
+                        columns=[{"name": i.replace('_', ' ').title(), "id": i} for i in df_students.columns if not i.startswith('_')],
+                        data=df_students.to_dict('records'),
                     
-                    # Apply improved styles
-                    style_header=TABLE_STYLE_HEADER,
-                    style_data=TABLE_STYLE_DATA,
-                    style_cell=TABLE_STYLE_CELL,
-
-                    style_data_conditional=[
-                        {
-                            'if': {'filter_query': '{Vibe_Score} <= 60'},
-                            'backgroundColor': '#632b2b', 'color': '#f87171', 'fontWeight': 'bold'
-                        },
-                        {
-                            'if': {'filter_query': '{Vibe_Score} > 60 && {Vibe_Score} <= 75'},
-                            'backgroundColor': '#625b29', 'color': '#fde047'
-                        }
-                    ],
-                    row_selectable='single',
-                    selected_rows=[],
-                    sort_action='native',
-                    filter_action='native',
-                    style_table={'overflowX': 'auto'} # Allows horizontal scroll if necessary, preventing overflow
-                )
-            ], style={**CYBER_CARD_STYLE}),
-        ], md=5, className="mb-4"),
+                        # Apply improved styles
+                        style_header=TABLE_STYLE_HEADER,
+                        style_data=TABLE_STYLE_DATA,
+                        style_cell=TABLE_STYLE_CELL,
+
+                        style_data_conditional=[
+                            {
+                                'if': {'filter_query': "{_Bucket} = 'low'"},
+                                'backgroundColor': '#632b2b', 'color': '#f87171', 'fontWeight': 'bold'
+                            },
+                            {
+                                'if': {'filter_query': "{_Bucket} = 'mid'"},
+                                'backgroundColor': '#625b29', 'color': '#fde047'
+                            }
+                        ],
+                        row_selectable='single',
+                        selected_rows=[],
+                        sort_action='native',
+                        filter_action='native',
+                        style_table={'overflowX': 'auto'} # Allows horizontal scroll if necessary, preventing overflow
+                    )
+                ], style={**CYBER_CARD_STYLE}),
+            ], md=5, className="mb-4"),
         
-        # COLUMN 2: Historical Progress Graph
-        dbc.Col([
-            dbc.Card([
-                html.H3(id='student-graph-title', children='HISTORICAL TRENDS // SELECT STUDENT', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
-                html.P('View the Vibe Score trend for the selected learner.', className='text-gray-400 mb-4'),
-                dcc.Graph(id='student-historical-graph', style={'height': '450px'}),
-            ], style={**CYBER_CARD_STYLE}),
-        ], md=7, className="mb-4"),
-    ]),
-])
+            # COLUMN 2: Historical Progress Graph
+            dbc.Col([
+                dbc.Card([
+                    html.H3(id='student-graph-title', children='HISTORICAL TRENDS // SELECT STUDENT', className='text-xl font-bold mb-3', style=NEON_TEXT_STYLE),
+                    html.P('View the Vibe Score trend for the selected learner.', className='text-gray-400 mb-4'),
+                    dcc.Graph(id='student-historical-graph', figure=_BASE_STUDENT_FIG, style={'height': '450px'}),
+                ], style={**CYBER_CARD_STYLE}),
+            ], md=7, className="mb-4"),
+        ]),
+    ])
+
+
+def layout(**_kwargs):
+    """Page layout entry point.
+
+    Dash's pages router calls this with any path variables and query-string
+    parameters; this page uses neither, so they are accepted and ignored and
+    every visit shares the one cached tree.
+    """
+    return _build_layout()
 
 # --- CALLBACKS ---
 
@@ -140,51 +210,33 @@ layout = html.Div([
     Input('student-table', 'selected_rows')
 )
 def update_graph_on_click(selected_rows):
+    # Everything but x/y/title/annotations is shared with the base figure, so
+    # only those keys go over the wire as a Patch.
+    patch = Patch()
+
     if not selected_rows:
         # Default state with no student selected
-        fig = go.Figure()
-        fig.add_annotation(
-            text="[AWAITING LEARNER SELECTION]",
-            xref="paper", yref="paper", x=0.5, y=0.5,
-            showarrow=False,
-            font={'size': 18, 'color': '#ec4899', 'family': 'monospace'}
-        )
-        fig.update_layout(
-            template='plotly_dark',
-            paper_bgcolor='#111827',
-            plot_bgcolor='#111827',
-            xaxis={'showgrid': False, 'zeroline': False, 'visible': False},
-            yaxis={'showgrid': False, 'zeroline': False, 'visible': False},
-        )
+        patch['data'][0]['x'] = []
+        patch['data'][0]['y'] = []
+        patch['layout']['annotations'] = [_AWAITING_ANNOTATION]
+        patch['layout']['title'] = {}
+        patch['layout']['xaxis']['visible'] = False
+        patch['layout']['yaxis']['visible'] = False
         title = 'HISTORICAL TRENDS // SELECT STUDENT'
-        return fig, title
-    
+        return patch, title
+
     # Get the selected student's ID
-    selected_id = df_students.iloc[selected_rows[0]]['Student_ID']
-    
-    # Generate historical data for the selected student
-    historical_df = get_historical_data(selected_id)
-    
-    # Create the plot
-    fig = go.Figure(
-        data=go.Scatter(
-            x=historical_df['Date'],
-            y=historical_df['Vibe_Score'],
-            mode='lines+markers',
-            line={'color': '#22d3ee', 'width': 4},
-            marker={'size': 10, 'color': '#22d3ee'}
-        )
-    )
-    
-    # Update layout to match the cyber theme
-    fig.update_layout(
-        template='plotly_dark',
-        paper_bgcolor='#111827',
-        plot_bgcolor='#111827',
-        title={'text': f'VIBE SCORE HISTORY // {selected_id}', 'font': {'color': '#e5e7eb'}},
-        xaxis={'title': 'Date', 'showgrid': False},
-        yaxis={'title': 'Vibe Score', 'range': [0, 100]}
-    )
-    
+    selected_id = _get_df_students().iloc[selected_rows[0]]['Student_ID']
+
+    # Cached, deterministic history for the selected student
+    dates, scores = get_historical_data(selected_id)
+
+    patch['data'][0]['x'] = dates
+    patch['data'][0]['y'] = list(scores)
+    patch['layout']['annotations'] = []
+    patch['layout']['title'] = {'text': f'VIBE SCORE HISTORY // {selected_id}', 'font': {'color': '#e5e7eb'}}
+    patch['layout']['xaxis']['visible'] = True
+    patch['layout']['yaxis']['visible'] = True
+
     title = f'HISTORICAL TRENDS // {selected_id}'
-    return fig, title
+    return patch, title